@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 # blend_mode_functions/__init__.py
 
-from .blend_mode_functions import blend_images
+from .blend_mode_functions import blend_images, apply_blend_mode, alpha_composite, prepare_images, SUPPORTED_MODES
 
 __all__ = [
-    'blend_images'
+    'blend_images',
+    'apply_blend_mode',
+    'alpha_composite',
+    'prepare_images',
+    'SUPPORTED_MODES'
 ]
 
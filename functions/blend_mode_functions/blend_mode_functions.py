@@ -4,7 +4,7 @@
 #
 # Author: Dani
 # Created: 2022-01-22
-# Last Modified: 2024-08-21
+# Last Modified: 2026-10-15
 #
 # Part of the Blend Mode Compendium Project
 # Requires: numpy
@@ -14,9 +14,21 @@
 # from blend_mode_functions import blend_images
 # blended_image = blend_images(image1, image2, alpha, blend_mode)
 
+from functools import partial
 import numpy as np
+from .blend_modes_u8 import BLEND_MODES_U8, alpha_blend_u8
 epsilon = 1e-10
 
+# For each hue sector (0-5), which of (C, X, 0) goes to the R, G and B channels
+_HUE_SECTOR_CHANNELS = np.array([
+    [0, 1, 2],  # 0 <= H' < 1: (C, X, 0)
+    [1, 0, 2],  # 1 <= H' < 2: (X, C, 0)
+    [2, 0, 1],  # 2 <= H' < 3: (0, C, X)
+    [2, 1, 0],  # 3 <= H' < 4: (0, X, C)
+    [1, 2, 0],  # 4 <= H' < 5: (X, 0, C)
+    [0, 2, 1],  # 5 <= H' < 6: (C, 0, X)
+])
+
 def screen(image1, image2):
     """
     Applies the Screen blend mode to two images.
@@ -32,99 +44,174 @@ def screen(image1, image2):
     Returns:
     - blended_image (numpy.ndarray): The result of applying the Screen blend mode.
     """
-    
-    return 1 - (1 - image1) * (1 - image2)
+    out = np.subtract(1, image1)
+    out *= 1 - image2
+    return np.subtract(1, out, out=out)
 
-def calculate_color_brightness(image):
+def soft_light(image1, image2):
+    """
+    Applies the Soft Light blend mode to two images.
+
+    Both halves of Soft Light have the form a + (2b - 1) * g, where g is
+    a(1 - a) when the blend layer is dark and sqrt(a) - a when it is light,
+    so g is selected in place and the rest is computed in a single buffer.
+
+    Parameters:
+    - image1 (numpy.ndarray): First image array with values in [0, 1].
+    - image2 (numpy.ndarray): Second image array with values in [0, 1].
+
+    Returns:
+    - blended_image (numpy.ndarray): The result of applying the Soft Light blend mode.
+    """
+    g = np.sqrt(image1)
+    g -= image1
+    dark_g = np.subtract(1, image1)
+    dark_g *= image1
+    np.copyto(g, dark_g, where=image2 <= 0.5)
+
+    out = np.multiply(image2, 2, out=dark_g)
+    out -= 1
+    out *= g
+    out += image1
+    return out
+
+def pin_light(image1, image2):
+    """
+    Applies the Pin Light blend mode to two images.
+
+    Pin Light takes the darker of image1 and 2b where the blend layer is dark
+    and the lighter of image1 and 2b - 1 where it is light. For image1 in [0, 1]
+    this is the same as clipping image1 to [2b - 1, 2b], since the other bound
+    never applies.
+
+    Parameters:
+    - image1 (numpy.ndarray): First image array with values in [0, 1].
+    - image2 (numpy.ndarray): Second image array with values in [0, 1].
+
+    Returns:
+    - blended_image (numpy.ndarray): The result of applying the Pin Light blend mode.
+    """
+    upper = np.multiply(image2, 2)
+    out = np.subtract(upper, 1)
+    np.maximum(image1, out, out=out)
+    np.minimum(out, upper, out=out)
+    return out
+
+def luma(r, g, b, out=None):
+    """
+    Calculates the Rec. 601 luma of the R, G and B channels.
+
+    The weighted channels are summed in a fixed order, element by element, so the
+    result does not depend on the memory layout or size of the arrays.
+    """
     #https://www.w3.org/TR/AERT/#color-contrast
-    return 0.299 * image[:, :, 0] + 0.587 * image[:, :, 1] + 0.114 * image[:, :, 2]
+    out = np.multiply(r, 0.299, out=out)
+    weighted = np.multiply(g, 0.587)
+    out += weighted
+    out += np.multiply(b, 0.114, out=weighted)
+    return out
 
-def rgb_to_hcl(image):
+def calculate_color_brightness(image):
+    return luma(image[:, :, 0], image[:, :, 1], image[:, :, 2])
+
+def to_planar(image):
     """
-    Convert an RGB image to HCL (Hue, Chroma, Luma)
+    Converts an interleaved (H, W, C) image to a contiguous planar (3, H, W) RGB array.
 
     Parameters:
-    image (numpy.ndarray): The RGB image with values in the range [0, 1].
+    image (numpy.ndarray): The interleaved image. Channels beyond RGB are dropped.
 
     Returns:
-    numpy.ndarray: The HCL image with values in the range [0, 1].
+    numpy.ndarray: The planar image, with each channel contiguous in memory.
+    """
+    return np.ascontiguousarray(np.moveaxis(image[:, :, 0:3], -1, 0))
+
+def from_planar(planar_image):
+    """
+    Returns an interleaved (H, W, 3) view of a planar (3, H, W) image.
+    """
+    return np.moveaxis(planar_image, 0, -1)
+
+def rgb_to_hcl_planar(rgb):
+    """
+    Convert a planar RGB image to planar HCL (Hue, Chroma, Luma)
+
+    Parameters:
+    rgb (numpy.ndarray): The (3, H, W) RGB image with values in the range [0, 1].
+
+    Returns:
+    numpy.ndarray: The (3, H, W) HCL image with values in the range [0, 1].
     """
     # Split the image into R, G, and B channels
-    r, g, b = image[:, :, 0], image[:, :, 1], image[:, :, 2]
+    r, g, b = rgb[0], rgb[1], rgb[2]
 
     # Calculate max and min values for each pixel
     maxc = np.maximum(np.maximum(r, g), b)
     minc = np.minimum(np.minimum(r, g), b)
     
+    # Preallocate the HCL image and write each plane into it directly
+    hcl = np.empty((3,) + maxc.shape, dtype=np.result_type(rgb, np.float32))
+    h, c, l = hcl
+
     # Calculate chroma
-    c = maxc - minc
+    np.subtract(maxc, minc, out=c)
     
-    # Calculate hue (h)
-    h = np.zeros_like(maxc)
-    mask = c != 0
-    h[mask & (maxc == r)] = (g[mask & (maxc == r)] - b[mask & (maxc == r)]) / c[mask & (maxc == r)]
-    h[mask & (maxc == g)] = 2.0 + (b[mask & (maxc == g)] - r[mask & (maxc == g)]) / c[mask & (maxc == g)]
-    h[mask & (maxc == b)] = 4.0 + (r[mask & (maxc == b)] - g[mask & (maxc == b)]) / c[mask & (maxc == b)]
+    # Calculate hue (h), leaving achromatic pixels (c == 0) at 0
+    inv_c = np.zeros_like(c)
+    np.divide(1.0, c, out=inv_c, where=c != 0)
+    # Ties resolve to the later channel (b over g over r)
+    sector_hue = np.select(
+        [c == 0, maxc == b, maxc == g],
+        [0.0, 4.0 + (r - g) * inv_c, 2.0 + (b - r) * inv_c],
+        default=(g - b) * inv_c
+    )
 
     # Normalize hue to [0, 1]
-    h = (h / 6.0) % 1.0
+    np.divide(sector_hue, 6.0, out=h)
+    h %= 1.0
     
     # Calculate luma (l)
-    l = calculate_color_brightness(image)
+    luma(r, g, b, out=l)
     
-    # Stack H, S, and L channels into an HSL image
-    hcl_image = np.stack([h, c, l], axis=-1)
+    return hcl
 
-    return hcl_image
-
-def hcl_to_rgb(hcl_image):
+def hcl_to_rgb_planar(hcl):
     """
-    Convert an HCL image (Hue, Chroma, Luma) to RGB.
+    Convert a planar HCL image (Hue, Chroma, Luma) to planar RGB.
     Hue is scaled to [0, 1].
     
     Parameters:
-    hcl_image (numpy.ndarray): The HCL image with values in the range [0, 1].
+    hcl (numpy.ndarray): The (3, H, W) HCL image with values in the range [0, 1].
     
     Returns:
-    numpy.ndarray: The RGB image with values in the range [0, 1].
+    numpy.ndarray: The (3, H, W) RGB image with values in the range [0, 1].
     """
-    h, c, l = hcl_image[:, :, 0], hcl_image[:, :, 1], hcl_image[:, :, 2]
+    h, c, l = hcl[0], hcl[1], hcl[2]
     
     # Hue scaled to [0, 6] to handle sectors
     h_prime = h * 6
+    sector = np.clip(h_prime.astype(np.intp), 0, 5)
     
-    # Intermediate value X, depending on which sector of H' we're in
-    x = c * (1 - np.abs(h_prime % 2 - 1))
-
-    # Initialize RGB values
-    r1 = np.zeros_like(h)
-    g1 = np.zeros_like(h)
-    b1 = np.zeros_like(h)
-
-    # Assign RGB1 based on the sector of the hue
-    mask = (0 <= h_prime) & (h_prime < 1)
-    r1[mask], g1[mask], b1[mask] = c[mask], x[mask], 0
-
-    mask = (1 <= h_prime) & (h_prime < 2)
-    r1[mask], g1[mask], b1[mask] = x[mask], c[mask], 0
-
-    mask = (2 <= h_prime) & (h_prime < 3)
-    r1[mask], g1[mask], b1[mask] = 0, c[mask], x[mask]
-
-    mask = (3 <= h_prime) & (h_prime < 4)
-    r1[mask], g1[mask], b1[mask] = 0, x[mask], c[mask]
-
-    mask = (4 <= h_prime) & (h_prime < 5)
-    r1[mask], g1[mask], b1[mask] = x[mask], 0, c[mask]
-
-    mask = (5 <= h_prime) & (h_prime < 6)
-    r1[mask], g1[mask], b1[mask] = c[mask], 0, x[mask]
+    # Candidate channel values (C, X, 0), with the intermediate value X
+    # depending on which sector of H' we're in
+    channels = np.zeros((3,) + c.shape, dtype=np.result_type(hcl, np.float32))
+    channels[0] = c
+    # X = C * (1 - |H' mod 2 - 1|), where H' mod 2 is H' minus the even sector below it
+    x = np.subtract(h_prime, sector & ~1, out=channels[1])
+    x -= 1
+    np.abs(x, out=x)
+    np.subtract(1, x, out=x)
+    x *= c
+
+    # Assign RGB1 based on the sector of the hue with a single gather
+    rgb1 = np.take_along_axis(channels, _HUE_SECTOR_CHANNELS.T[:, sector], axis=0)
+    luma1 = luma(rgb1[0], rgb1[1], rgb1[2])
 
     # Calculate adjustment value to match luma (Y601)
-    m = (l - (0.299 * r1 + 0.587 * g1 + 0.114 * b1))
+    m = (l - luma1)
     
     #calculate scale factor
-    ms = np.where(l>0,(0.299 * r1 + 0.587 * g1 + 0.114 * b1)/l,epsilon)
+    ms = np.where(l>0,luma1/l,epsilon)
 
     #calculate add factor
     ma = np.where(m+x>1, 2*m + c + x - 2, (m+c-1)/2)
@@ -133,205 +220,370 @@ def hcl_to_rgb(hcl_image):
     # case 1 (too bright): m + c > 1: add remainder to other channels
     # case 2 (normal): 0 <= m <= 1 - c : add m to all channels
     # case 3 (too dark): m < 0 : divide rgb1 by scale factor brightness/luma
-    r = np.clip(np.where(m+c>1, r1 + m + ma, np.where(m<0, r1/(ms+epsilon), r1 + m)),0,1)
-    g = np.clip(np.where(m+c>1, g1 + m + ma, np.where(m<0, g1/(ms+epsilon), g1 + m)),0,1)
-    b = np.clip(np.where(m+c>1, b1 + m + ma, np.where(m<0, b1/(ms+epsilon), b1 + m)),0,1)
-    
-    # Stack R, G, B channels into an RGB image
-    rgb_image = np.stack([r, g, b], axis=-1)
+    # All three planes are computed at once, broadcasting the per-pixel factors
+    rgb = np.where(m+c>1, rgb1 + m + ma, np.where(m<0, rgb1/(ms+epsilon), rgb1 + m))
+    return np.clip(rgb, 0, 1, out=rgb)
+
+def rgb_to_hcl(image):
+    """
+    Convert an RGB image to HCL (Hue, Chroma, Luma)
+
+    Parameters:
+    image (numpy.ndarray): The RGB image with values in the range [0, 1].
 
-    return rgb_image
+    Returns:
+    numpy.ndarray: The HCL image with values in the range [0, 1].
+    """
+    return from_planar(rgb_to_hcl_planar(to_planar(image)))
+
+def hcl_to_rgb(hcl_image):
+    """
+    Convert an HCL image (Hue, Chroma, Luma) to RGB.
+    Hue is scaled to [0, 1].
+    
+    Parameters:
+    hcl_image (numpy.ndarray): The HCL image with values in the range [0, 1].
+    
+    Returns:
+    numpy.ndarray: The RGB image with values in the range [0, 1].
+    """
+    return from_planar(hcl_to_rgb_planar(to_planar(hcl_image)))
 
 def hue(image1, image2):
-    # Convert both images from RGB to HCL
-    hcl1 = rgb_to_hcl(image1)
-    hcl2 = rgb_to_hcl(image2)
+    # Convert both images from RGB to planar HCL
+    hcl1 = rgb_to_hcl_planar(to_planar(image1))
+    hcl2 = rgb_to_hcl_planar(to_planar(image2))
     
     # Create the resulting HSL image by taking the hue from image2 and the saturation and lightness from image1
-    result_hcl = np.stack([hcl2[:, :, 0], hcl1[:, :, 1], hcl1[:, :, 2]], axis=-1)
+    hcl1[0] = hcl2[0]
     
     # Convert the result back to RGB
-    return hcl_to_rgb(result_hcl)
+    return from_planar(hcl_to_rgb_planar(hcl1))
 
 def saturation(image1, image2):
-    # Convert both images from RGB to HCL
-    hcl1 = rgb_to_hcl(image1)
-    hcl2 = rgb_to_hcl(image2)
+    # Convert both images from RGB to planar HCL
+    hcl1 = rgb_to_hcl_planar(to_planar(image1))
+    hcl2 = rgb_to_hcl_planar(to_planar(image2))
     
     # Combine the hue and lightness of the base image (image1) with the saturation of the blend image (image2)
-    result_hcl = np.stack([hcl1[:, :, 0], hcl2[:, :, 1], hcl1[:, :, 2]], axis=-1)
+    hcl1[1] = hcl2[1]
     
     # Convert the result back to RGB
-    return hcl_to_rgb(result_hcl)
+    return from_planar(hcl_to_rgb_planar(hcl1))
 
 def color(image1, image2):
-    # Convert both images from RGB to HCL
-    hcl1 = rgb_to_hcl(image1)
-    hcl2 = rgb_to_hcl(image2)
+    # Convert both images from RGB to planar HCL
+    hcl1 = rgb_to_hcl_planar(to_planar(image1))
+    hcl2 = rgb_to_hcl_planar(to_planar(image2))
     
     # Create the resulting HCL image by taking the hue and saturation from image2 and the lightness from image1
-    result_hcl = np.stack([hcl2[:, :, 0], hcl2[:, :, 1], hcl1[:, :, 2]], axis=-1)
+    hcl2[2] = hcl1[2]
     
     # Convert the result back to RGB
-    return hcl_to_rgb(result_hcl)
+    return from_planar(hcl_to_rgb_planar(hcl2))
 
 def luminosity(image1, image2):
-    # Convert both images from RGB to HCL
-    hcl1 = rgb_to_hcl(image1)
-    hcl2 = rgb_to_hcl(image2)
+    # Convert both images from RGB to planar HCL
+    hcl1 = rgb_to_hcl_planar(to_planar(image1))
+    hcl2 = rgb_to_hcl_planar(to_planar(image2))
     
     # Create the resulting HCL image by taking the hue and saturation from image1 and the lightness from image2
-    result_hcl = np.stack([hcl1[:, :, 0], hcl1[:, :, 1], hcl2[:, :, 2]], axis=-1)
+    hcl1[2] = hcl2[2]
     
     # Convert the result back to RGB
-    return hcl_to_rgb(result_hcl)
+    return from_planar(hcl_to_rgb_planar(hcl1))
 
-def blend_images(image1, image2, alpha=1, blend_mode='normal'):
+def blend_tiled(blend_function, image1, image2, tile_size=256):
     """
-    Blends two images using the specified alpha value.
+    Applies a blend mode tile by tile so that its intermediate arrays stay cache-sized.
+
+    Parameters:
+    - blend_function: Function of (image1, image2) returning the blended image.
+    - image1 (numpy.ndarray): First image array with values in [0, 1].
+    - image2 (numpy.ndarray): Second image array with values in [0, 1].
+    - tile_size (int): Height and width of each tile in pixels.
+
+    Returns:
+    - blended_image (numpy.ndarray): The result of applying blend_function to the whole image.
+    """
+    height, width = image1.shape[:2]
+    if height <= tile_size and width <= tile_size:
+        return blend_function(image1, image2)
+
+    blended_image = None
+    for top in range(0, height, tile_size):
+        for left in range(0, width, tile_size):
+            tile = (slice(top, top + tile_size), slice(left, left + tile_size))
+            blended_tile = blend_function(image1[tile], image2[tile])
+            if blended_image is None:
+                blended_image = np.empty((height, width) + blended_tile.shape[2:], dtype=blended_tile.dtype)
+            blended_image[tile] = blended_tile
+    return blended_image
+
+def darker_color(image1, image2):
+    # Keep the pixels of image1 that are no brighter than image2 (color brightness formula)
+    mask = calculate_color_brightness(image1) <= calculate_color_brightness(image2)
+    return np.where(mask[:, :, None], image1, image2)
+
+def lighter_color(image1, image2):
+    # Keep the pixels of image1 that are no darker than image2 (color brightness formula)
+    mask = calculate_color_brightness(image1) >= calculate_color_brightness(image2)
+    return np.where(mask[:, :, None], image1, image2)
+
+def overlay(image1, image2):
+    # Screen (1 - 2(1 - a)(1 - b)) and multiply (2ab) are computed over the whole
+    # image, then multiply is copied over screen where image1 is dark
+    out = np.subtract(1, image1)
+    out *= 1 - image2
+    out *= -2
+    out += 1
+    product = np.multiply(image1, image2)
+    product *= 2
+    np.copyto(out, product, where=image1 < 0.5)
+    return out
+
+def hard_light(image1, image2):
+    # Hard Light is Overlay with the two layers swapped
+    return overlay(image2, image1)
+
+def saturating_divide(dividend, divisor, out=None):
+    """
+    Divides dividend by divisor, saturating x / 0 to 1 (and 0 / 0 to 0) where the
+    divisor is not above epsilon. out may be either of the inputs.
+    """
+    # Record the saturated values before out can overwrite the inputs
+    zero = divisor <= epsilon
+    saturated = dividend[zero] > 0
+    # A single unmasked divide, the few zero divisors are patched afterwards
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = np.divide(dividend, divisor, out=out)
+    out[zero] = saturated
+    return out
+
+def color_burn(image1, image2):
+    # 1 - (1 - image1) / image2, where (1 - image1) / 0 saturates to 1
+    out = np.subtract(1, image1)
+    saturating_divide(out, image2, out=out)
+    # Prevent values greater than 1
+    np.minimum(out, 1, out=out)
+    return np.subtract(1, out, out=out)
+
+def color_dodge(image1, image2):
+    # image1 / (1 - image2), where image1 / 0 saturates to 1
+    out = np.subtract(1, image2)
+    saturating_divide(image1, out, out=out)
+    # Prevent values greater than 1
+    return np.clip(out, 0, 1, out=out)
+
+def divide(image1, image2):
+    # image1 / image2, where image1 / 0 saturates to 1
+    return saturating_divide(image1, image2)
+
+def vivid_light(image1, image2):
+    # Color burn with 2 * image2 where image2 is dark, color dodge with 2 * image2 - 1 where it is light.
+    # Both halves are computed for every pixel with unmasked ufuncs and merged once at the end
+    double_image2 = np.multiply(image2, 2)
+    burn = np.subtract(1, image1)
+    saturating_divide(burn, double_image2, out=burn)
+    np.subtract(1, burn, out=burn)
+
+    dodge = np.subtract(2, double_image2, out=double_image2)
+    saturating_divide(image1, dodge, out=dodge)
+    np.copyto(dodge, burn, where=image2 <= 0.5)
+    return dodge
+
+def linear_burn(image1, image2):
+    out = np.add(image1, image2)
+    out -= 1
+    return np.maximum(out, 0, out=out)
+
+def linear_dodge(image1, image2):
+    out = np.add(image1, image2)
+    return np.clip(out, 0, 1, out=out)
+
+def linear_light(image1, image2):
+    out = np.multiply(image2, 2)
+    out += image1
+    out -= 1
+    return out
+
+def difference(image1, image2):
+    out = np.subtract(image1, image2)
+    return np.abs(out, out=out)
+
+def exclusion(image1, image2):
+    # a + b - 2ab, accumulated in one buffer
+    out = np.multiply(image1, image2)
+    out *= -2
+    out += image1
+    out += image2
+    return np.abs(out, out=out)
+
+def subtract(image1, image2):
+    out = np.subtract(image1, image2)
+    return np.clip(out, 0, 1, out=out)
+
+# Blend mode name -> function of (image1, image2) returning the unblended result
+BLEND_MODES = {
+    'normal': lambda image1, image2: image2,
+    'darken': np.minimum,
+    'multiply': np.multiply,
+    'color burn': color_burn,
+    'linear burn': linear_burn,
+    'darker color': darker_color,
+    'lighten': np.maximum,
+    'screen': screen,
+    'color dodge': color_dodge,
+    'linear dodge': linear_dodge,
+    'lighter color': lighter_color,
+    'overlay': overlay,
+    'soft light': soft_light,
+    'hard light': hard_light,
+    'vivid light': vivid_light,
+    'linear light': linear_light,
+    'pin light': pin_light,
+    'hard mix': lambda image1, image2: (image1 + image2 >= 1).astype(np.result_type(image1, image2, 1.0)),
+    'difference': difference,
+    'exclusion': exclusion,
+    'subtract': subtract,
+    'divide': divide,
+    # The HCL round trip creates many intermediates, so it is run tile by tile
+    'hue': partial(blend_tiled, hue),
+    'saturation': partial(blend_tiled, saturation),
+    'color': partial(blend_tiled, color),
+    'luminosity': partial(blend_tiled, luminosity),
+}
+
+# Names of the implemented blend modes, for checking a mode before blending
+SUPPORTED_MODES = frozenset(BLEND_MODES)
+
+def drop_alpha_channel(image):
+    """
+    Returns the RGB channels of an (H, W, 4) RGBA image, other images unchanged.
+    """
+    if image.ndim == 3 and image.shape[-1] == 4:
+        return image[:, :, 0:3]
+    return image
+
+def check_images(image1, image2):
+    """
+    Checks that two images can be blended together and drops their alpha channels.
 
     Parameters:
     - image1: First image as a NumPy array.
     - image2: Second image as a NumPy array.
-    - alpha: Blending factor. 0.0 gives the first image, 1.0 gives the second image.
 
     Returns:
-    - Blended image as a NumPy array.
+    - image1, image2: The RGB channels of the images.
     """
-    skipone = False #sets flag for cases where we need to skip without erroring out
-    
     # Ensure both images have the same dimensions
     if image1.shape != image2.shape:
         raise ValueError("Images must have the same dimensions for blending.")
 
-    # Perform the blending based on the specified blend mode
-    if blend_mode == 'normal':
-        blended_image = image2
-        
-    elif blend_mode == 'darken':
-        blended_image = np.minimum(image1, image2)
-        
-    elif blend_mode == 'multiply':
-        blended_image = image1 * image2
-        
-    elif blend_mode == 'color burn':
-        # Avoid division by zero and prevent values greater than 1
-        blended_image = 1 - np.minimum(1, (1 - image1) / np.clip(image2, epsilon, 1))
-    
-    elif blend_mode == 'linear burn':
-        blended_image = np.maximum(0, image1 + image2 - 1)    
-    
-    elif blend_mode == 'darker color':
-        # Apply the color brightness formula
-        brightness_image1 = calculate_color_brightness(image1)
-        brightness_image2 = calculate_color_brightness(image2)
-        # Find the minimum sum between the two images
-        min_sum = np.minimum(brightness_image1, brightness_image2)
-        # Use np.where to select colors based on the minimum sum
-        mask = (brightness_image1 == min_sum)
-        blended_image = np.where(mask[:, :, None], image1, image2)
-        
-    elif blend_mode == 'lighten':
-        blended_image = np.maximum(image1, image2)    
-    
-    elif blend_mode == 'screen':
-        blended_image = screen(image1, image2)
-        
-    elif blend_mode == 'color dodge':
-        # Avoid division by zero and prevent values greater than 1
-        blended_image = np.clip(image1 / (1 - image2 + epsilon), 0, 1)
-        
-    elif blend_mode == 'linear dodge':
-        blended_image = np.clip(image1 + image2, 0, 1)    
-    
-    elif blend_mode == 'lighter color':
-        # Apply the color brightness formula
-        brightness_image1 = calculate_color_brightness(image1)
-        brightness_image2 = calculate_color_brightness(image2)
-        # Find the maximum sum between the two images
-        min_sum = np.maximum(brightness_image1, brightness_image2)
-        # Use np.where to select colors based on the maximum sum
-        mask = (brightness_image1 == min_sum)
-        blended_image = np.where(mask[:, :, None], image1, image2) 
-        
-    elif blend_mode == 'overlay':
-        blended_image = np.where(
-            image1 < 0.5,
-            2 * image2 * image1,
-            1 - 2 * (1 - image2) * (1 - image1)
-        )   
-        
-    elif blend_mode == 'soft light':
-        blended_image = np.where(
-            image2 <= 0.5,
-            image1 * (1 - (1 - 2 * image2) * (1 - image1)),
-            image1 + (2 * image2 - 1) * (np.sqrt(image1) - image1)
-        )
-        
-    elif blend_mode == 'hard light':
-        blended_image = np.where(
-            image2 < 0.5,
-            2 * image2 * image1,
-            1 - 2 * (1 - image2) * (1 - image1)
-        )   
-        
-    elif blend_mode == 'vivid light':
-        blended_image = np.where(
-            image2 <= 0.5,
-            1 - (1 - image1) / (2 * image2 + 1e-10),
-            image1 / (2 * (1 - image2) + 1e-10)
-        )
-     
-    elif blend_mode == 'linear light':
-        blended_image = image1 + 2 * image2 - 1
-        
-    elif blend_mode == 'pin light':
-        blended_image = np.where(
-            image2 <= 0.5,
-            np.minimum(image1, 2 * image2),
-            np.maximum(image1, 2 * (image2 - 0.5))
-        )
-        
-    elif blend_mode == 'hard mix':
-        blended_image = np.where(image1 + image2 >= 1, 1, 0)    
-        
-    elif blend_mode == 'difference':
-        blended_image = np.abs(image1[:,:,0:3] - image2[:,:,0:3])       
-        
-    elif blend_mode == 'exclusion':
-        blended_image = np.abs(image1 + image2 - 2 * image1 * image2)
-        
-    elif blend_mode == 'subtract':
-        blended_image = np.clip(image1 - image2, 0, 1)
-    
-    elif blend_mode == 'divide':
-        # Avoid division by zero by adding a small value to image2
-        blended_image = np.divide(image1, np.clip(image2, epsilon, 1))
-        
-    elif blend_mode == 'hue':
-        blended_image = hue(image1, image2)
-        
-    elif blend_mode == 'saturation':
-        blended_image = saturation(image1, image2)
-        
-    elif blend_mode == 'color':
-        blended_image = color(image1, image2)
-        
-    elif blend_mode == 'luminosity':
-        blended_image = luminosity(image1, image2)
-        
-    else:
+    # Only the color channels are blended, an alpha channel is dropped
+    return drop_alpha_channel(image1), drop_alpha_channel(image2)
+
+def to_float_image(image):
+    """
+    Converts an image to single precision with values in [0, 1].
+
+    Single precision is plenty for 8-bit-ish image data and halves the memory
+    traffic compared to float64. uint8 images are scaled from [0, 255].
+    """
+    if image.dtype == np.uint8:
+        return np.divide(image, 255, dtype=np.float32)
+    return image.astype(np.float32, copy=False)
+
+def prepare_images(image1, image2):
+    """
+    Checks two images and converts them to the form the blend modes work on.
+
+    Parameters:
+    - image1: First image as a NumPy array, either floats in [0, 1] or uint8.
+    - image2: Second image as a NumPy array, either floats in [0, 1] or uint8.
+
+    Returns:
+    - image1, image2: float32 RGB images with values in [0, 1].
+    """
+    image1, image2 = check_images(image1, image2)
+    return to_float_image(image1), to_float_image(image2)
+
+def apply_blend_mode(image1, image2, blend_mode='normal'):
+    """
+    Applies a blend mode to two images at full opacity, without alpha blending or clipping.
+
+    The images are checked and converted with prepare_images first.
+
+    Parameters:
+    - image1: First image as a NumPy array, either floats in [0, 1] or uint8.
+    - image2: Second image as a NumPy array, either floats in [0, 1] or uint8.
+    - blend_mode: Name of the blend mode, see BLEND_MODES.
+
+    Returns:
+    - Blended float32 RGB image as a NumPy array, or None if the blend mode is not implemented.
+    """
+    blend_function = BLEND_MODES.get(blend_mode)
+    if blend_function is None:
         print('not implemented yet: ', blend_mode)
-        skipone = True
         #raise ValueError(f"Not implemented yet: {blend_mode}")
+        return None
+    image1, image2 = prepare_images(image1, image2)
+    return blend_function(image1, image2)
+
+def alpha_composite(image1, blended_image, alpha=1):
+    """
+    Blends an image with the result of a blend mode using the specified alpha value.
+
+    Parameters:
+    - image1: Base image as a NumPy array, either floats in [0, 1] or uint8. An alpha
+      channel is dropped, as in apply_blend_mode.
+    - blended_image: Result of apply_blend_mode for image1.
+    - alpha: Blending factor. 0.0 gives the first image, 1.0 gives the blended image.
+      Either a number or an array that broadcasts against the images, e.g. (H, W, 1).
 
-    if not skipone:
-        # Alpha blending
-        blended_image = (1 - alpha) * image1 + alpha * blended_image
-        
-        # Clip values to be in the valid range [0, 255] for image data
-        blended_image = np.clip(blended_image, 0, 1)
-        
-        return blended_image
-    else:
-        skipone = False
\ No newline at end of file
+    Returns:
+    - Blended image as a NumPy array with values clipped to [0, 1].
+    """
+    # Bring image1 to the form apply_blend_mode blended it in
+    image1 = to_float_image(drop_alpha_channel(image1))
+
+    # Alpha blending, accumulated into a single output buffer
+    out = np.multiply(blended_image, alpha, dtype=np.result_type(image1, blended_image, 1.0), order='C')
+    # The image1 term is skipped for a constant alpha of 1, alpha may also be a per-pixel mask
+    if np.ndim(alpha) != 0 or alpha != 1:
+        out += np.multiply(image1, 1 - alpha, dtype=out.dtype)
+
+    # Clip values in place to be in the valid range [0, 1] for image data
+    np.clip(out, 0, 1, out=out)
+
+    return out
+
+def blend_images(image1, image2, alpha=1, blend_mode='normal'):
+    """
+    Blends two images using the specified alpha value.
+
+    Parameters:
+    - image1: First image as a NumPy array, either floats in [0, 1] or uint8.
+    - image2: Second image as a NumPy array, either floats in [0, 1] or uint8.
+    - alpha: Blending factor. 0.0 gives the first image, 1.0 gives the second image.
+
+    Returns:
+    - Blended RGB image as a float32 NumPy array, uint8 if both inputs are uint8.
+    """
+    image1, image2 = check_images(image1, image2)
+
+    # 8-bit images use the fixed-point kernels where the blend mode has one,
+    # otherwise they are blended in [0, 1] and converted back to 8-bit
+    if image1.dtype == np.uint8 and image2.dtype == np.uint8:
+        if blend_mode in BLEND_MODES_U8:
+            return alpha_blend_u8(image1, BLEND_MODES_U8[blend_mode](image1, image2), alpha)
+        blended_image = blend_images(to_float_image(image1), to_float_image(image2), alpha, blend_mode)
+        if blended_image is not None:
+            return np.rint(blended_image * 255).astype(np.uint8)
+        return
+
+    # Perform the blending based on the specified blend mode
+    image1, image2 = prepare_images(image1, image2)
+    blended_image = apply_blend_mode(image1, image2, blend_mode)
+    if blended_image is not None:
+        return alpha_composite(image1, blended_image, alpha)
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# blend_modes_u8.py
+# This file contains fixed-point versions of the blend modes that can be computed
+# exactly on 8-bit images
+#
+# Author: Dani
+# Created: 2026-10-15
+# Last Modified: 2026-10-15
+#
+# Part of the Blend Mode Compendium Project
+# Requires: numpy
+#
+# Usage: Import this module and call the functions with appropriate parameters.
+# Images are uint8 arrays with values in [0, 255].
+# Example:
+# from blend_modes_u8 import multiply_u8
+# blended_image = multiply_u8(image1, image2)
+
+import numpy as np
+
+def div255(x):
+    """
+    Divides a uint16 array of products of two 8-bit values by 255, rounding to nearest.
+
+    The input array is used as scratch space and is overwritten.
+
+    Parameters:
+    - x (numpy.ndarray): uint16 array with values in [0, 255 * 255].
+
+    Returns:
+    - result (numpy.ndarray): uint8 array equal to round(x / 255).
+    """
+    x += 128
+    x += x >> 8
+    return np.right_shift(x, 8, out=np.empty(x.shape, dtype=np.uint8), casting='unsafe')
+
+def normal_u8(image1, image2):
+    return image2.copy()
+
+def multiply_u8(image1, image2):
+    return div255(np.multiply(image1, image2, dtype=np.uint16))
+
+def screen_u8(image1, image2):
+    # 255 - (255 - a)(255 - b) / 255 == a + b - ab / 255
+    out = np.add(image1, image2, dtype=np.uint16)
+    out -= div255(np.multiply(image1, image2, dtype=np.uint16))
+    return out.astype(np.uint8)
+
+def darken_u8(image1, image2):
+    return np.minimum(image1, image2)
+
+def lighten_u8(image1, image2):
+    return np.maximum(image1, image2)
+
+def linear_burn_u8(image1, image2):
+    # Saturating a - (255 - b), kept in 8 bits
+    out = np.subtract(255, image2, dtype=np.uint8)
+    np.minimum(out, image1, out=out)
+    return np.subtract(image1, out, out=out)
+
+def linear_dodge_u8(image1, image2):
+    # Saturating a + b, kept in 8 bits
+    out = np.subtract(255, image1, dtype=np.uint8)
+    np.minimum(out, image2, out=out)
+    return np.add(image1, out, out=out)
+
+def difference_u8(image1, image2):
+    out = np.maximum(image1, image2)
+    out -= np.minimum(image1, image2)
+    return out
+
+def subtract_u8(image1, image2):
+    # Saturating a - b, kept in 8 bits
+    out = np.minimum(image1, image2)
+    return np.subtract(image1, out, out=out)
+
+def hard_mix_u8(image1, image2):
+    return (np.add(image1, image2, dtype=np.uint16) >= 255).view(np.uint8) * np.uint8(255)
+
+def alpha_blend_u8(image1, blended_image, alpha):
+    """
+    Blends two 8-bit images using the specified alpha value.
+
+    Parameters:
+    - image1 (numpy.ndarray): Base image as a uint8 array.
+    - blended_image (numpy.ndarray): Blend mode result as a uint8 array.
+    - alpha: Blending factor. 0.0 gives the first image, 1.0 gives the second image.
+      Either a number or an array that broadcasts against the images, e.g. (H, W, 1).
+
+    Returns:
+    - Blended image as a uint8 array.
+    """
+    if np.ndim(alpha) == 0:
+        weight = int(round(alpha * 255))
+        if weight == 255:
+            return blended_image
+    else:
+        # Per-pixel alpha, e.g. an (H, W, 1) mask
+        weight = np.rint(np.multiply(alpha, 255)).astype(np.uint16)
+    out = np.multiply(image1, 255 - weight, dtype=np.uint16)
+    out += np.multiply(blended_image, weight, dtype=np.uint16)
+    return div255(out)
+
+BLEND_MODES_U8 = {
+    'normal': normal_u8,
+    'darken': darken_u8,
+    'multiply': multiply_u8,
+    'linear burn': linear_burn_u8,
+    'lighten': lighten_u8,
+    'screen': screen_u8,
+    'linear dodge': linear_dodge_u8,
+    'hard mix': hard_mix_u8,
+    'difference': difference_u8,
+    'subtract': subtract_u8,
+}
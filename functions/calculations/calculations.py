@@ -4,7 +4,7 @@
 #
 # Author: Dani
 # Created: 2022-01-22
-# Last Modified: 2024-08-23
+# Last Modified: 2026-10-15
 #
 # Part of the Blend Mode Compendium Project
 # Requires: numpy
@@ -16,16 +16,39 @@
 
 import numpy as np
 
-def calculate_absolute_error(image1, image2):
+def calculate_absolute_error(image1, image2, axis=None, out=None, block_rows=256):
     """
     Calculates the Sum of Absolute Error (SAE) between two color images.
 
     Parameters:
     - image1 (numpy.ndarray): First image array with values in [0, 1].
     - image2 (numpy.ndarray): Second image array with values in [0, 1].
+    - axis (int or tuple of ints): Axes to sum over. Defaults to all axes; pass the
+      image axes to compare a stack of images against one image in a single call.
+    - out (numpy.ndarray): Optional buffer for the absolute differences, e.g. one of the
+      inputs if it is no longer needed. A new array is allocated if not given.
+    - block_rows (int): Number of rows summed at a time when summing over all axes
+      without an out buffer, so only a small temporary is allocated.
 
     Returns:
-    - sae (float): Sum of Absolute Error between the two images.
+    - sae (float or numpy.ndarray): Sum of Absolute Error between the two images.
     """
+    if np.ndim(image1) == 0 and np.ndim(image2) == 0:
+        # Single values have no rows to block or buffer to reuse
+        return np.sum(np.abs(np.subtract(image1, image2)), axis=axis)
+
+    if out is None and axis is None and np.ndim(image1) >= 1:
+        # Sum the absolute differences a block of rows at a time into one small buffer
+        image1, image2 = np.broadcast_arrays(image1, image2)
+        num_rows = len(image1)
+        buffer = np.empty((min(block_rows, num_rows),) + image1.shape[1:], dtype=np.result_type(image1, image2))
+        sae = np.sum(buffer[:0])
+        for start in range(0, num_rows, block_rows):
+            stop = min(start + block_rows, num_rows)
+            difference = np.subtract(image1[start:stop], image2[start:stop], out=buffer[:stop - start])
+            sae += np.sum(np.abs(difference, out=difference))
+        return sae
+
     # Calculate SAE by summing the absolute differences across all channels
-    return np.sum(np.abs(image1 - image2))
\ No newline at end of file
+    difference = np.subtract(image1, image2, out=out)
+    return np.sum(np.abs(difference, out=difference), axis=axis)
\ No newline at end of file
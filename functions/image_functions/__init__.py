@@ -2,13 +2,15 @@
 # image_functions/__init__.py
 
 from .display_images import plot_2_images, create_alpha_transition_graphic
-from .generate_images import generate_rainbow_colors, generate_striped_images, load_and_crop_to_square
+from .generate_images import generate_rainbow_colors, generate_striped_images, load_and_crop_to_square, read_image_u8, load_cached_image
 
 __all__ = [
     'plot_2_images',
     'create_alpha_transition_graphic',
     'generate_rainbow_colors',
     'generate_striped_images',
-    'load_and_crop_to_square'
+    'load_and_crop_to_square',
+    'read_image_u8',
+    'load_cached_image'
 ]
 
@@ -4,7 +4,7 @@
 #
 # Author: Dani
 # Created: 2022-01-22
-# Last Modified: 2024-08-21
+# Last Modified: 2026-10-15
 #
 # Part of the Blend Mode Compendium Project
 # Requires: matplotlib, numpy, PIL
@@ -16,9 +16,27 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
-from ..blend_mode_functions import blend_images
+from ..blend_mode_functions import apply_blend_mode, alpha_composite, prepare_images
 #..folder1.functionA import some_function_from_A
 
+def to_display_image(image):
+    """
+    Converts an image with values in [0, 1] to uint8 for display.
+    uint8 images are returned unchanged.
+
+    Parameters:
+    - image: Image as a NumPy array.
+
+    Returns:
+    - The image as a uint8 NumPy array with values in [0, 255].
+    """
+    if image.dtype == np.uint8:
+        return image
+    display_image = np.multiply(image, 255)
+    np.clip(display_image, 0, 255, out=display_image)
+    np.rint(display_image, out=display_image)
+    return display_image.astype(np.uint8)
+
 def plot_2_images(image_A, image_B, caption_A="Image A", caption_B="Image B", show=True):
     """
     Plots two images side by side with custom captions.
@@ -32,12 +50,12 @@ def plot_2_images(image_A, image_B, caption_A="Image A", caption_B="Image B", sh
     fig, axs = plt.subplots(1, 2, figsize=(12, 6))
 
     # Display first image
-    axs[0].imshow((np.round(image_A*255)).astype(int))
+    axs[0].imshow(to_display_image(image_A))
     axs[0].axis('off')  # Hide the axes
     axs[0].set_title(caption_A)
 
     # Display second image
-    axs[1].imshow((np.round(image_B*255)).astype(int))
+    axs[1].imshow(to_display_image(image_B))
     axs[1].axis('off')  # Hide the axes
     axs[1].set_title(caption_B)
 
@@ -50,8 +68,8 @@ def create_alpha_transition_graphic(image1, image2, num_steps=5, blend_mode='nor
     Creates a graphic with a sequence of images transitioning between two input images with varying alpha values.
     
     Parameters:
-    - image1: The first input PIL image.
-    - image2: The second input PIL image.
+    - image1: The first input image as a NumPy array with values in [0, 1].
+    - image2: The second input image as a NumPy array with values in [0, 1].
     - num_steps: Number of transition steps (default is 5).
     
     Returns:
@@ -60,13 +78,21 @@ def create_alpha_transition_graphic(image1, image2, num_steps=5, blend_mode='nor
     # Calculate the alpha values
     alphas = np.linspace(0, 1, num_steps)
     
+    # Check and convert the images once, image1 is also used for every alpha composite
+    image1, image2 = prepare_images(image1, image2)
+    
+    # The blend mode does not depend on alpha, so it is only applied once
+    blended_image = apply_blend_mode(image1, image2, blend_mode)
+    if blended_image is None:
+        return
+    
     # Create a figure to display the images
     fig, axes = plt.subplots(1, num_steps, figsize=(num_steps * 4, 5))
     
     # For each alpha value, blend the images and display them in the figure
     for i, alpha in enumerate(alphas):
-        blended_image = blend_images(image1, image2, alpha, blend_mode)
-        axes[i].imshow((np.round(blended_image*255)).astype(int))
+        transition_image = alpha_composite(image1, blended_image, alpha)
+        axes[i].imshow(to_display_image(transition_image))
         axes[i].axis('off')
         axes[i].set_title(f"Alpha: {alpha:.2f}", fontsize=12)
     
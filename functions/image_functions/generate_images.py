@@ -4,64 +4,84 @@
 #
 # Author: Dani
 # Created: 2022-01-22
-# Last Modified: 2024-08-21
+# Last Modified: 2026-10-15
 #
 # Part of the Blend Mode Compendium Project
-# Requires: colorsys, numpy
+# Requires: numpy, matplotlib, PIL
 # 
 # Usage: Import this module and call the functions with appropriate parameters.
 # Example:
 # from generate_images import generate_rainbow_colors
 # colors = generate_rainbow_colors(numColors)
 
-import colorsys
+import os
+import tempfile
+from functools import lru_cache
 import numpy as np
 import matplotlib.pyplot as plt
+from PIL import Image
 
 def generate_rainbow_colors(num_colors):
     """
-    Generates a list of colors in the rainbow using HSL color space.
+    Generates an array of colors in the rainbow using HSL color space.
     
     Parameters:
     - num_colors: Number of colors to generate.
     
     Returns:
-    - A list of RGB tuples representing the rainbow colors.
+    - A (num_colors, 3) float32 array of RGB colors representing the rainbow colors.
+      Each row is one color, colors.T gives the separate R, G and B channels.
     """
-    colors = []
-    for i in range(num_colors):
-        hue = i / num_colors  # Vary hue from 0 to 1
-        rgb = colorsys.hls_to_rgb(hue, 0.5, 1.0)  # Convert HSL to RGB (lightness = 0.5, saturation = 1.0)
-        colors.append(rgb)
-    return colors
+    if num_colors == 0:
+        return np.empty((0, 3), dtype=np.float32)
+    
+    # Vary hue from 0 to 1, scaled to the six sectors of the color wheel
+    hue_sectors = np.arange(num_colors, dtype=np.float32) * (6 / num_colors)
+    
+    # With lightness = 0.5 and saturation = 1.0, HSL to RGB reduces to a
+    # piecewise-linear ramp per channel, offset by 5, 3 and 1 sectors for R, G and B
+    k = (hue_sectors[:, None] + np.array([5, 3, 1], dtype=np.float32)) % 6
+    return 1 - np.clip(np.minimum(k, 4 - k), 0, 1)
 
-def generate_striped_images(num_colors=12, image_size=12):
+@lru_cache(maxsize=8)
+def generate_striped_images(num_colors=12, image_size=12, dtype=np.float32):
     """
     Generates two images with horizontal and vertical rainbow stripes.
     
+    The images are cached per set of parameters and returned as read-only
+    broadcast views, so use .copy() before modifying them in place.
+    
     Parameters:
     - num_colors: Number of stripes/colors in the rainbow.
     - image_size: Size of the square image (height and width).
+    - dtype: Data type of the images. Float types hold values in [0, 1],
+      uint8 holds values in [0, 255].
     
     Returns:
     - image_horizontal_stripes: Image with horizontal stripes.
     - image_vertical_stripes: Image with vertical stripes.
     """
     # Generate the rainbow colors
-    rainbow_colors = generate_rainbow_colors(num_colors)
+    palette = generate_rainbow_colors(num_colors)
+    if np.dtype(dtype) == np.uint8:
+        palette = np.rint(palette * 255).astype(np.uint8)
+    else:
+        palette = palette.astype(dtype, copy=False)
     
-    # Create empty images for horizontal and vertical stripes
-    image_horizontal_stripes = np.zeros((image_size, image_size, 3))
-    image_vertical_stripes = np.zeros((image_size, image_size, 3))
+    # Stripe boundaries (the same for horizontal and vertical stripes), spread so
+    # every row/column belongs to a stripe even if image_size is not a multiple
+    # of num_colors
+    stripe_edges = np.linspace(0, image_size, num_colors + 1, dtype=np.int64)
     
-    # Calculate stripe dimensions
-    stripe_height = image_size // num_colors
-    stripe_width = image_size // num_colors
+    # Palette index of each row of the horizontal stripes / column of the vertical stripes
+    stripe_index = np.repeat(np.arange(num_colors), np.diff(stripe_edges))
+    stripe_colors = palette[stripe_index]
     
-    # Fill the image with horizontal and vertical stripes
-    for i, color in enumerate(rainbow_colors):
-        image_horizontal_stripes[i * stripe_height:(i + 1) * stripe_height, :] = color
-        image_vertical_stripes[:, i * stripe_width:(i + 1) * stripe_width] = color
+    # Broadcast the stripe colors across the other axis, the images are read-only
+    # views of the (image_size, 3) stripe colors rather than full copies
+    image_shape = (image_size, image_size, stripe_colors.shape[-1])
+    image_horizontal_stripes = np.broadcast_to(stripe_colors[:, None, :], image_shape)
+    image_vertical_stripes = np.broadcast_to(stripe_colors[None, :, :], image_shape)
        
     return image_horizontal_stripes, image_vertical_stripes
 
@@ -104,3 +124,68 @@ def load_and_crop_to_square(image_path_A, image_path_B):
     cropped_B = image_B[top_B:top_B + final_size, left_B:left_B + final_size]
 
     return cropped_A/255, cropped_B/255
+
+def read_image_u8(image_path):
+    """
+    Decodes an image file with Pillow into an 8-bit RGB or RGBA array.
+    
+    Palette, grayscale and other 8-bit modes are converted to RGB, or to RGBA when
+    they carry transparency, so the result always has 3 or 4 channels. Images with
+    more than 8 bits per channel are rejected, since converting them would clip
+    the values instead of rescaling them.
+    
+    Parameters:
+    - image_path (str): File path to the image.
+    
+    Returns:
+    - image (numpy.ndarray): uint8 image of shape (H, W, 3) or (H, W, 4).
+    """
+    with Image.open(image_path) as image:
+        if image.mode in ('I', 'F') or image.mode.startswith('I;'):
+            raise ValueError(f"Unsupported image mode '{image.mode}' in {image_path}: only 8-bit images can be read.")
+        if image.mode not in ('RGB', 'RGBA'):
+            has_alpha = 'A' in image.mode or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+        return np.asarray(image)
+
+def load_cached_image(image_path, cache_dir=None, dtype=np.float32):
+    """
+    Loads an image from file, keeping a decoded .npy copy so later loads can
+    memory-map the pixels instead of decoding the file again.
+    
+    Parameters:
+    - image_path (str): File path to the image.
+    - cache_dir (str): Directory for the decoded copies. Defaults to a '.npy_cache'
+      folder next to the image.
+    - dtype: Data type of the image. Float types hold values in [0, 1],
+      uint8 holds the decoded 8-bit values.
+    
+    Returns:
+    - image (numpy.ndarray): Read-only memory-mapped image.
+    """
+    image_dir, filename = os.path.split(image_path)
+    if cache_dir is None:
+        cache_dir = os.path.join(image_dir, '.npy_cache')
+    dtype = np.dtype(dtype)
+    # Keep the extension in the name so 'a.jpg' and 'a.png' get separate copies
+    cache_path = os.path.join(cache_dir, f"{filename}_{dtype.name}.npy")
+
+    # Decode the image again if it changed since the cached copy was written
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(image_path):
+        os.makedirs(cache_dir, exist_ok=True)
+        image = read_image_u8(image_path)
+        if dtype != np.uint8:
+            image = np.divide(image, 255, dtype=dtype)
+        
+        # Write to a temporary file first, so an interrupted write never leaves a
+        # truncated copy at cache_path
+        fd, temp_path = tempfile.mkstemp(suffix='.npy', dir=cache_dir)
+        try:
+            with os.fdopen(fd, 'wb') as cache_file:
+                np.save(cache_file, image)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    return np.load(cache_path, mmap_mode='r')
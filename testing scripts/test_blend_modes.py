@@ -6,58 +6,116 @@
 #
 # Author: Dani
 # Created: 2022-01-22
-# Last Modified: 2024-08-23
+# Last Modified: 2026-10-15
 #
 # Part of the Blend Mode Compendium Project
-# Requires: numpy, os, matplotlib
+# Requires: numpy, os, concurrent.futures
 # 
-# Usage: Current configuration loops over 'photoshop images' directory for images
+# Usage: Current configuration loops over the folders in TEST_CASES for images
 # in the form test_blend_mode.png. Run the script from the testing scripts
 # directory to execute the test.
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import numpy as np
-import matplotlib.pyplot as plt
-from functions.blend_mode_functions import blend_images
-from functions.image_functions import generate_striped_images, load_and_crop_to_square
+from functions.blend_mode_functions import blend_images, prepare_images, SUPPORTED_MODES
+from functions.blend_mode_functions.blend_modes_u8 import BLEND_MODES_U8
+from functions.image_functions import generate_striped_images, load_and_crop_to_square, read_image_u8, load_cached_image
 from functions.calculations import calculate_absolute_error
-import matplotlib.image as mpimg
+
+# Photoshop blend modes that give the same result as an implemented blend mode at
+# full opacity, which is how the photoshop images were made. (Color and hue only
+# match for the stripe test images, so they are not aliases.)
+MODE_ALIASES = {
+    'dissolve': 'normal',
+}
+
+# Each blend of the full-size photos keeps several hundred MB of buffers alive,
+# so only a few blend modes are processed at the same time
+MAX_WORKERS = 4
+
+def _blend_mode_from_filename(filename):
+    # Extract the blend mode from the filename
+    blend_mode = filename[len("test_"):-len(".png")]
+    
+    # Replace underscores with spaces in the blend mode
+    return blend_mode.replace('_', ' ')
+
+def _process_one(blend_mode, entries, images, float_images, threshold=0.0):
+    # Names of the blend modes of the reference images, which may be aliases of blend_mode
+    names = [_blend_mode_from_filename(entry.name) for entry in entries]
+    
+    # Skip blend modes without an implementation before decoding anything
+    if blend_mode not in SUPPORTED_MODES:
+        return [f"not implemented {name}" for name in names]
+    
+    try:
+        # Create blended image using same blend_mode, once for all its reference images
+        if blend_mode in BLEND_MODES_U8:
+            # The 8-bit inputs give an 8-bit result, computed with the fixed-point kernels
+            generated_image = blend_images(*images, blend_mode=blend_mode).astype(np.int16)
+        else:
+            # Other blend modes use the float32 images shared by all blend modes, scaled
+            # to 8-bit values in place (blend_images returns a new buffer clipped to [0, 1])
+            generated_image = blend_images(*float_images, blend_mode=blend_mode)
+            generated_image *= 255
+            generated_image = np.rint(generated_image, out=generated_image).astype(np.int16)
+    except (NotImplementedError, KeyError):
+        return [f"not implemented {name}" for name in names]
+    
+    results = []
+    difference = np.empty_like(generated_image)
+    for name, entry in zip(names, entries):
+        # Load the actual image, already as 8-bit values
+        actual_image = read_image_u8(entry.path).astype(np.int16)
+        
+        #calculate SAE, reusing one buffer for the differences
+        sae = calculate_absolute_error(actual_image[:,:,0:3], generated_image, out=difference)
+        if sae > threshold:
+            results.append(f"Images '{name}' have SAE: {sae:.5f}")
+    return results
 
 def process_images(image_folder, image1, image2):
     image_dir = os.path.join(os.path.dirname(__file__), '..', image_folder)  # Get the test images directory
+    
+    # Group the reference images by blend mode, so each blend mode is computed once
+    # (including for its aliases)
+    entries_by_blend_mode = {}
+    with os.scandir(image_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".png"):
+                blend_mode = _blend_mode_from_filename(entry.name)
+                blend_mode = MODE_ALIASES.get(blend_mode, blend_mode)
+                entries_by_blend_mode.setdefault(blend_mode, []).append(entry)
 
-    for filename in os.listdir(image_dir):
-        threshold = 0.0
-        if filename.endswith(".png"):
-            # Extract the blend mode from the filename
-            blend_mode = filename[len("test_"):-len(".png")]
-            
-            # Replace underscores with spaces in the blend mode
-            blend_mode = blend_mode.replace('_', ' ')
-            
-            # Load the actual image
-            actual_image_path = os.path.join(image_dir, filename)
-            actual_image = (np.round(255*plt.imread(actual_image_path))).astype(int)
-            
-            try:
-                # Create blended image using same blend_mode
-                generated_image = (np.round(blend_images(image1, image2, blend_mode=blend_mode)*255)).astype(int)
-                
-                np.clip(generated_image, 0, 255)
-                
-                #calculate SAE
-                sae = calculate_absolute_error(actual_image[:,:,0:3], generated_image[:,:,0:3])
-                if sae > threshold:
-                    print(f"Images '{blend_mode}' have SAE: {sae:.5f}")
-            except:
-                print('not implemented', blend_mode)
+    # Convert the input images to float32 once for the blend modes without 8-bit kernels
+    float_images = prepare_images(image1, image2)
+
+    # Decoding and blending release the GIL, so threads can share the input images
+    # without copying them to worker processes
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, os.cpu_count() or 1)) as executor:
+        process_one = partial(_process_one, images=(image1, image2), float_images=float_images)
+        results = executor.map(process_one, entries_by_blend_mode, entries_by_blend_mode.values())
+        
+        # Print in the order the blend modes were found, as the results come in
+        for group_results in results:
+            for result in group_results:
+                print(result)
             
-image_folder = "photoshop images"  # Folder where your images are stored
-test_dir = os.path.join(os.path.dirname(__file__), '..', 'test images')
-image1 = mpimg.imread(os.path.join(test_dir,'image_horizontal_stripes.png'))
-image2 = mpimg.imread(os.path.join(test_dir,'image_vertical_stripes.png'))
-process_images(image_folder, image1, image2)
-image_folder = "photoshop images 2"  # Folder where your images are stored
-image1 = mpimg.imread(os.path.join(test_dir,'imageAcropped.png'))
-image2 = mpimg.imread(os.path.join(test_dir,'imageBcropped.png'))
-process_images(image_folder, image1, image2)
\ No newline at end of file
+# Folders of photoshop images with the test images they were created from
+TEST_CASES = [
+    ("photoshop images", 'image_horizontal_stripes.png', 'image_vertical_stripes.png'),
+    ("photoshop images 2", 'imageAcropped.png', 'imageBcropped.png'),
+]
+
+def main():
+    test_dir = os.path.join(os.path.dirname(__file__), '..', 'test images')
+    for image_folder, image1_file, image2_file in TEST_CASES:
+        # Load each pair of test images only once its folder is processed
+        image1 = load_cached_image(os.path.join(test_dir, image1_file), dtype=np.uint8)
+        image2 = load_cached_image(os.path.join(test_dir, image2_file), dtype=np.uint8)
+        process_images(image_folder, image1, image2)
+
+if __name__ == '__main__':
+    main()
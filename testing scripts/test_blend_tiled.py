@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# test_blend_tiled.py
+# This script checks that the blend modes run tile by tile (see blend_tiled) give
+# exactly the same result as applying them to the whole image at once.
+#
+# Author: Dani
+# Created: 2026-10-15
+# Last Modified: 2026-10-15
+#
+# Part of the Blend Mode Compendium Project
+# Requires: numpy
+#
+# Usage: Run the script from the repository root to execute the test. Any blend
+# mode whose tiled result differs from the untiled result is printed.
+
+import numpy as np
+from functions.blend_mode_functions.blend_mode_functions import blend_tiled, hue, saturation, color, luminosity
+
+# Image sizes that are not multiples of the tile size, so edge tiles are partial
+IMAGE_SHAPES = [(700, 530, 3), (530, 700, 4)]
+TILE_SIZES = [256, 100]
+
+def main():
+    rng = np.random.default_rng(0)
+    for shape in IMAGE_SHAPES:
+        image1 = rng.random(shape, dtype=np.float32)
+        image2 = rng.random(shape, dtype=np.float32)
+        for blend_function in (hue, saturation, color, luminosity):
+            untiled = blend_function(image1, image2)
+            for tile_size in TILE_SIZES:
+                tiled = blend_tiled(blend_function, image1, image2, tile_size=tile_size)
+                if not np.array_equal(tiled, untiled):
+                    max_error = np.max(np.abs(tiled - untiled))
+                    print(f"Tiled '{blend_function.__name__}' differs for {shape} with tile size {tile_size}: max error {max_error}")
+
+if __name__ == '__main__':
+    main()
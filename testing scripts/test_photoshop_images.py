@@ -7,42 +7,84 @@
 #
 # Author: Dani
 # Created: 2022-01-22
-# Last Modified: 2024-08-21
+# Last Modified: 2026-10-15
 #
 # Part of the Blend Mode Compendium Project
-# Requires: os, matplotlib
+# Requires: os, numpy
 # 
 # Usage: Current configuration loops over 'photoshop images' directory for images
 # beginning with 'test' and ending with '.png'. Run the script from the testing scripts
 # directory to execute the test.
 
 import os
-import matplotlib.pyplot as plt
+import numpy as np
 from functions.calculations import calculate_absolute_error
+from functions.image_functions import read_image_u8
 
-def compare_images(image_files, threshold=0.1):
+def load_image(file):
+    # Decode as 8-bit RGB(A) and scale to [0, 1]
+    return np.divide(read_image_u8(file), 255, dtype=np.float32)
+
+def block_sums(image, factor):
+    # Sum the pixels of each factor x factor block of an (H, W, C) image, dropping
+    # rows/columns left over at the edges. Images smaller than one block use a
+    # single block the size of their smaller side.
+    height, width, num_channels = image.shape
+    factor = max(1, min(factor, height, width))
+    height = height // factor * factor
+    width = width // factor * factor
+    blocks = image[:height, :width].reshape(height // factor, factor, width // factor, factor, num_channels)
+    return blocks.sum(axis=(1, 3), dtype=np.float64)
+
+def compare_images(image_files, threshold=0.1, block_size=64, pool_factor=8):
     """
     Compares all images in the list and prints file names and similarity scores for pairs below the threshold.
 
+    Only the images of pairs that pass two cheap prefilters, on the channel sums and
+    on downsampled images, are decoded for the full comparison, so the whole set is
+    never held in memory at once.
+
     Parameters:
     - image_files (list): List of image file paths.
     - threshold (float): Similarity threshold for flagging similar images. Lower MSE indicates higher similarity.
+    - block_size (int): Number of images compared against each image at once, to bound memory use.
+    - pool_factor (int): Size of the pixel blocks summed for the downsampled images.
     """
-    # Load all images
-    images = [plt.imread(file) for file in image_files]
+    # Decode the images one at a time, keeping only their per-channel and per-block sums
+    channel_sums = []
+    pooled_images = []
+    for file in image_files:
+        image = np.atleast_3d(load_image(file))
+        channel_sums.append(image.sum(axis=(0, 1), dtype=np.float64))
+        pooled_images.append(block_sums(image, pool_factor))
+    channel_sums = np.stack(channel_sums)
+    
+    # |sum(a) - sum(b)| <= sum(|a - b|) for each channel, so pairs whose channel sums
+    # differ by the threshold or more cannot be below it
+    lower_bounds = np.abs(channel_sums[:, None] - channel_sums[None, :]).sum(axis=-1)
     
-    # Compare each image with every other image
-    num_images = len(images)
+    # Compare each image with the later images that pass the prefilter, a block of images at a time
+    num_images = len(image_files)
     for i in range(num_images):
-        for j in range(i + 1, num_images):
-            sae = calculate_absolute_error(images[i], images[j])
-            if sae < threshold:
+        candidates = np.flatnonzero(lower_bounds[i, i + 1:] < threshold) + i + 1
+        
+        # The SAE of the block sums is a tighter lower bound for the same reason
+        candidates = [j for j in candidates if calculate_absolute_error(pooled_images[i], pooled_images[j]) < threshold]
+        if not candidates:
+            continue
+        image = load_image(image_files[i])
+        for start in range(0, len(candidates), block_size):
+            block = np.array(candidates[start:start + block_size])
+            others = np.stack([load_image(image_files[j]) for j in block])
+            sae_row = calculate_absolute_error(others, image, axis=tuple(range(1, others.ndim)))
+            for j, sae in zip(block[sae_row < threshold], sae_row[sae_row < threshold]):
                 similarity_score = 1 - sae  # Higher score indicates more similarity
                 print(f"Images '{image_files[i]}' and '{image_files[j]}' are {similarity_score:.2f} similar (SAE: {sae:.5f})")
 
 # Test images
 image_dir = os.path.join(os.path.dirname(__file__), '..', 'photoshop images')  # Get the test images directory
-image_files = [os.path.join(image_dir, f) for f in os.listdir(image_dir) if f.startswith('test') and f.endswith('.png')]
+with os.scandir(image_dir) as entries:
+    image_files = [entry.path for entry in entries if entry.name.startswith('test') and entry.name.endswith('.png')]
 
 compare_images(image_files)
 